@@ -21,6 +21,9 @@ class Cart:
 
         self.cart = cart
 
+        # Memoized shipping cost, reset whenever the cart changes
+        self._shipping_cost: Decimal | None = None
+
     def add(
         self,
         product: Product,
@@ -44,6 +47,9 @@ class Cart:
 
         self.session.modified = True
 
+        # cart contents changed, so shipping cost must be recalculated
+        self._shipping_cost = None
+
     def remove(self, product: Product) -> None:
         """Remove a product from the cart."""
         product_id = str(product.id)  # type: ignore
@@ -76,9 +82,14 @@ class Cart:
         return Decimal(product_sum).quantize(Decimal("0.01"))
 
     def get_shipping_cost(self) -> Decimal:
-        book_quantity = sum(item["quantity"] for item in self.cart.values())
+        # shipping cost is used several times per request,
+        # e.g., in the cart total and templates, so only calculate it once
+        if self._shipping_cost is None:
+            book_quantity = sum(item["quantity"] for item in self.cart.values())
+
+            self._shipping_cost = get_book_shipping_cost(book_quantity)
 
-        return get_book_shipping_cost(book_quantity)
+        return self._shipping_cost
 
     def clear(self) -> None:
         # remove cart from session
@@ -132,6 +132,23 @@ class CartTestCase(TestCase):
 
         self.assertEqual(shipping_cost, expected_shipping_cost)
 
+    def test_get_shipping_cost_recalculated_when_cart_changes(self) -> None:
+        cart = Cart(self.request)
+
+        cart.add(self.product1)
+
+        # one book is five dollars
+        self.assertEqual(cart.get_shipping_cost(), Decimal("5.00"))
+
+        cart.add(self.product2, quantity=2)
+
+        # three books are four dollars each
+        self.assertEqual(cart.get_shipping_cost(), Decimal("12.00"))
+
+        cart.remove(self.product2)
+
+        self.assertEqual(cart.get_shipping_cost(), Decimal("5.00"))
+
     def test_cart_iteration(self) -> None:
         cart = Cart(self.request)
 
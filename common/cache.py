@@ -0,0 +1,56 @@
+import time
+from collections.abc import Callable
+from typing import TypeVar
+
+from django.conf import settings
+from django.core.cache import cache
+
+T = TypeVar("T")
+
+
+def get_cache_version(version_key: str) -> int:
+    """Get the current version for a group of cache entries.
+
+    Include the version in cache keys, so that all entries in the group
+    can be invalidated at once with `invalidate_cache_version`.
+    """
+    version = cache.get(version_key)
+
+    if version is None:
+        version = invalidate_cache_version(version_key)
+
+    return version
+
+
+def invalidate_cache_version(version_key: str) -> int:
+    """Invalidate a group of cache entries by starting a new version.
+
+    A timestamp is used, rather than incrementing a counter,
+    so that an evicted version key can never be reset to a stale version.
+    """
+    version = time.time_ns()
+
+    cache.set(version_key, version, timeout=None)
+
+    return version
+
+
+def get_or_set_versioned(
+    version_key: str,
+    key: str,
+    default: Callable[[], T],
+    timeout: int,
+) -> T:
+    """Get a value from a group of versioned cache entries,
+    computing and caching it with `default` when missing.
+
+    Values are only cached when the cache is shared by all processes
+    (see the SHARED_CACHE setting), since invalidating the group
+    would not reach the other processes' caches.
+    """
+    if not settings.SHARED_CACHE:
+        return default()
+
+    version = get_cache_version(version_key)
+
+    return cache.get_or_set(f"{key}:{version}", default, timeout)
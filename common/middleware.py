@@ -0,0 +1,99 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+    HttpResponsePermanentRedirect,
+    HttpResponseRedirect,
+)
+from wagtail.contrib.redirects.middleware import RedirectMiddleware
+from wagtail.models import Site
+
+from common.cache import get_cache_version
+
+REDIRECTS_CACHE_VERSION_KEY = "redirects_cache_version"
+REDIRECTS_CACHE_TIMEOUT = 60 * 5  # five minutes
+
+# Cached value for paths that have no matching redirect
+NO_REDIRECT = ""
+
+
+def get_redirect_cache_key(
+    site_id: int | None,
+    path: str,
+) -> str:
+    # Hash the path, since it may be too long or contain characters
+    # that are not valid in some cache backends' keys
+    path_hash = hashlib.md5(path.encode()).hexdigest()
+
+    version = get_cache_version(REDIRECTS_CACHE_VERSION_KEY)
+
+    return f"redirect:{version}:{site_id}:{path_hash}"
+
+
+class CachedRedirectMiddleware(RedirectMiddleware):
+    """Wagtail redirect middleware that caches redirect lookups.
+
+    Wagtail queries the Redirect table up to four times for every 404 response.
+    Cache the outcome, including when there is no matching redirect,
+    so repeated requests for the same path don't query the database.
+
+    Lookups are only cached when the cache is shared by all processes
+    (see the SHARED_CACHE setting).
+    """
+
+    def process_response(
+        self,
+        request: HttpRequest,
+        response: HttpResponse,
+    ) -> HttpResponse:
+        # No need to check for a redirect for non-404 responses.
+        if response.status_code != 404:
+            return response
+
+        # Without a shared cache, other workers would keep serving
+        # stale redirects after one is changed
+        if not settings.SHARED_CACHE:
+            return super().process_response(request, response)
+
+        site = Site.find_for_request(request)
+
+        cache_key = get_redirect_cache_key(
+            site_id=site.pk if site else None,
+            path=request.get_full_path(),
+        )
+
+        cached_redirect = cache.get(cache_key)
+
+        if cached_redirect == NO_REDIRECT:
+            return response
+
+        if cached_redirect is not None:
+            link, is_permanent = cached_redirect
+
+            if is_permanent:
+                return HttpResponsePermanentRedirect(link)
+            else:
+                return HttpResponseRedirect(link)
+
+        redirect_response = super().process_response(request, response)
+
+        if redirect_response is response:
+            cache.set(
+                cache_key,
+                NO_REDIRECT,
+                REDIRECTS_CACHE_TIMEOUT,
+            )
+        else:
+            cache.set(
+                cache_key,
+                (
+                    redirect_response["Location"],
+                    isinstance(redirect_response, HttpResponsePermanentRedirect),
+                ),
+                REDIRECTS_CACHE_TIMEOUT,
+            )
+
+        return redirect_response
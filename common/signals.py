@@ -0,0 +1,15 @@
+from typing import Any
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from wagtail.contrib.redirects.models import Redirect
+
+from common.cache import invalidate_cache_version
+from common.middleware import REDIRECTS_CACHE_VERSION_KEY
+
+
+@receiver(post_save, sender=Redirect)
+@receiver(post_delete, sender=Redirect)
+def invalidate_redirects_cache_on_change(**kwargs: Any) -> None:
+    """Drop cached redirect lookups whenever a Redirect changes."""
+    invalidate_cache_version(REDIRECTS_CACHE_VERSION_KEY)
@@ -1 +1,136 @@
-# Create your tests here.
+from http import HTTPStatus
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from wagtail.contrib.redirects.models import Redirect
+from wagtail.models import Site
+
+from common.cache import get_cache_version
+from common.middleware import (
+    NO_REDIRECT,
+    REDIRECTS_CACHE_VERSION_KEY,
+    get_redirect_cache_key,
+)
+
+
+@override_settings(SHARED_CACHE=True)
+class CachedRedirectMiddlewareTest(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+
+        self.site = Site.objects.get(is_default_site=True)
+
+    def test_redirect(self) -> None:
+        Redirect.objects.create(
+            old_path="/old-path",
+            redirect_link="https://westernfriend.org/new-path",
+        )
+
+        response = self.client.get("/old-path/")
+
+        self.assertRedirects(
+            response,
+            "https://westernfriend.org/new-path",
+            status_code=HTTPStatus.MOVED_PERMANENTLY,
+            fetch_redirect_response=False,
+        )
+
+        # Repeated requests are served from the cache
+        response = self.client.get("/old-path/")
+
+        self.assertRedirects(
+            response,
+            "https://westernfriend.org/new-path",
+            status_code=HTTPStatus.MOVED_PERMANENTLY,
+            fetch_redirect_response=False,
+        )
+
+    def test_temporary_redirect(self) -> None:
+        Redirect.objects.create(
+            old_path="/old-path",
+            redirect_link="https://westernfriend.org/new-path",
+            is_permanent=False,
+        )
+
+        # The first request populates the cache, the second is served from it
+        for _ in range(2):
+            response = self.client.get("/old-path/")
+
+            self.assertRedirects(
+                response,
+                "https://westernfriend.org/new-path",
+                status_code=HTTPStatus.FOUND,
+                fetch_redirect_response=False,
+            )
+
+    def test_missing_redirect_is_cached(self) -> None:
+        response = self.client.get("/missing-path/")
+
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+
+        self.assertEqual(
+            cache.get(
+                get_redirect_cache_key(
+                    site_id=self.site.pk,
+                    path="/missing-path/",
+                ),
+            ),
+            NO_REDIRECT,
+        )
+
+    @override_settings(SHARED_CACHE=False)
+    def test_redirect_not_cached_without_shared_cache(self) -> None:
+        Redirect.objects.create(
+            old_path="/old-path",
+            redirect_link="https://westernfriend.org/new-path",
+        )
+
+        response = self.client.get("/old-path/")
+
+        self.assertEqual(response.status_code, HTTPStatus.MOVED_PERMANENTLY)
+
+        for path in ["/old-path/", "/missing-path/"]:
+            self.client.get(path)
+
+            self.assertIsNone(
+                cache.get(
+                    get_redirect_cache_key(
+                        site_id=self.site.pk,
+                        path=path,
+                    ),
+                ),
+            )
+
+    def test_cache_invalidated_when_redirect_created(self) -> None:
+        response = self.client.get("/old-path/")
+
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
+
+        version = get_cache_version(REDIRECTS_CACHE_VERSION_KEY)
+
+        Redirect.objects.create(
+            old_path="/old-path",
+            redirect_link="https://westernfriend.org/new-path",
+        )
+
+        self.assertNotEqual(get_cache_version(REDIRECTS_CACHE_VERSION_KEY), version)
+
+        response = self.client.get("/old-path/")
+
+        self.assertEqual(response.status_code, HTTPStatus.MOVED_PERMANENTLY)
+
+    def test_cache_invalidated_when_redirect_deleted(self) -> None:
+        redirect = Redirect.objects.create(
+            old_path="/old-path",
+            redirect_link="https://westernfriend.org/new-path",
+        )
+
+        response = self.client.get("/old-path/")
+
+        self.assertEqual(response.status_code, HTTPStatus.MOVED_PERMANENTLY)
+
+        redirect.delete()
+
+        response = self.client.get("/old-path/")
+
+        self.assertEqual(response.status_code, HTTPStatus.NOT_FOUND)
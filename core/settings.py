@@ -10,9 +10,12 @@ https://docs.djangoproject.com/en/2.1/ref/settings/
 """
 
 # Build paths inside the project like this: os.path.join(BASE_DIR, ...)
+import atexit
 import logging
 import os
+import queue
 import sys
+from logging.handlers import QueueListener, RotatingFileHandler
 
 import dj_database_url
 from django.core.management.utils import get_random_secret_key
@@ -22,20 +25,29 @@ from sentry_sdk.integrations.django import DjangoIntegration
 
 load_dotenv()
 
+# Management command being run, if any (e.g., "runserver", "test")
+MANAGEMENT_COMMAND = sys.argv[1] if len(sys.argv) > 1 else None
+
+IS_TEST = MANAGEMENT_COMMAND == "test"
+
 # Disable logging while running tests
-if len(sys.argv) > 1 and sys.argv[1] == "test":
+if IS_TEST:
     logging.disable(logging.CRITICAL)
 
 default_allowed_hosts = "127.0.0.1,localhost,westernfriend.eu.ngrok.io"
 
-ALLOWED_HOSTS = os.getenv("DJANGO_ALLOWED_HOSTS", default_allowed_hosts).split(",")
+ALLOWED_HOSTS = tuple(
+    os.getenv("DJANGO_ALLOWED_HOSTS", default_allowed_hosts).split(","),
+)
 
 default_csrf_trusted_origins = "http://127.0.0.1,https://127.0.0.1,http://localhost,https://localhost,https://westernfriend.eu.ngrok.io"
 
-CSRF_TRUSTED_ORIGINS = os.getenv(
-    "DJANGO_CSRF_TRUSTED_ORIGINS",
-    default_csrf_trusted_origins,
-).split(",")
+CSRF_TRUSTED_ORIGINS = tuple(
+    os.getenv(
+        "DJANGO_CSRF_TRUSTED_ORIGINS",
+        default_csrf_trusted_origins,
+    ).split(","),
+)
 
 CORE_DIR = os.path.dirname(__file__)
 BASE_DIR = os.path.dirname(CORE_DIR)
@@ -52,6 +64,26 @@ if DEBUG:
 else:
     SECRET_KEY = os.getenv("DJANGO_SECRET_KEY", get_random_secret_key())
 
+# Log records are written to the log file by a background thread,
+# so that disk writes don't block the thread doing the logging
+LOG_QUEUE: queue.Queue = queue.Queue(-1)
+
+log_file_handler = RotatingFileHandler(
+    filename=os.path.join(BASE_DIR, "debug.log"),
+    maxBytes=1024 * 1024 * 5,  # 5 MB
+    backupCount=5,
+)
+log_file_handler.setLevel(logging.DEBUG)
+
+log_queue_listener = QueueListener(
+    LOG_QUEUE,
+    log_file_handler,
+    respect_handler_level=True,
+)
+log_queue_listener.start()
+# Flush any remaining records to the log file on shutdown
+atexit.register(log_queue_listener.stop)
+
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
@@ -61,10 +93,8 @@ LOGGING = {
         },
         "file": {
             "level": "DEBUG",
-            "class": "logging.handlers.RotatingFileHandler",
-            "filename": os.path.join(BASE_DIR, "debug.log"),
-            "maxBytes": 1024 * 1024 * 5,  # 5 MB
-            "backupCount": 5,
+            "class": "logging.handlers.QueueHandler",
+            "queue": LOG_QUEUE,
         },
     },
     "formatters": {
@@ -85,10 +115,13 @@ LOGGING = {
     },
 }
 
+SENTRY_DSN = os.getenv("SENTRY_DSN")
+
 # if SENTRY_DSN is set, then we are running in production
-if os.getenv("SENTRY_DSN"):
+# skip initializing Sentry in debug mode, since errors are shown locally
+if SENTRY_DSN and not DEBUG:
     sentry_sdk.init(
-        dsn=os.getenv("SENTRY_DSN"),
+        dsn=SENTRY_DSN,
         integrations=[DjangoIntegration()],
         traces_sample_rate=0.1,
     )
@@ -201,7 +234,8 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "django.middleware.security.SecurityMiddleware",
-    "wagtail.contrib.redirects.middleware.RedirectMiddleware",
+    # Wagtail's RedirectMiddleware, with redirect lookups cached
+    "common.middleware.CachedRedirectMiddleware",
 ]
 
 X_FRAME_OPTIONS = "SAMEORIGIN"
@@ -233,10 +267,22 @@ WSGI_APPLICATION = "core.wsgi.application"
 # https://docs.djangoproject.com/en/2.1/ref/settings/#databases
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-NOT_COLLECTING_STATICFILES = len(sys.argv) > 1 and sys.argv[1] != "collectstatic"
+NOT_COLLECTING_STATICFILES = (
+    MANAGEMENT_COMMAND is not None and MANAGEMENT_COMMAND != "collectstatic"
+)
+
+# Keep database connections open between requests for this many seconds,
+# rather than reconnecting on every request (0 disables persistent connections)
+DATABASE_CONN_MAX_AGE = int(os.getenv("DJANGO_CONN_MAX_AGE", 60))
 
 if DATABASE_URL:
-    DATABASES = {"default": dj_database_url.parse(DATABASE_URL)}
+    DATABASES = {
+        "default": dj_database_url.parse(
+            DATABASE_URL,
+            conn_max_age=DATABASE_CONN_MAX_AGE,
+            conn_health_checks=True,
+        ),
+    }
 else:
     # Default to using local development environment
     if NOT_COLLECTING_STATICFILES:
@@ -248,15 +294,46 @@ else:
                 "PASSWORD": "postgres",
                 "HOST": "localhost",
                 "PORT": "5432",
+                "CONN_MAX_AGE": DATABASE_CONN_MAX_AGE,
+                "CONN_HEALTH_CHECKS": True,
             },
         }
 
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+REDIS_URL = os.getenv("REDIS_URL")
+
+if REDIS_URL:
+    # Shared between all processes, so cache invalidation reaches every worker
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        },
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        },
+    }
+
+# Data invalidated by signals (e.g., redirects and news listings) is only cached
+# when all processes share the cache, since invalidating a per-process cache
+# doesn't reach the other workers
+SHARED_CACHE = bool(REDIS_URL)
+
+# On PostgreSQL, the database backend resolves to Wagtail's PostgreSQL backend,
+# which stores search vectors in GIN-indexed columns.
+# Run `python manage.py update_index` after changing SEARCH_CONFIG.
 WAGTAILSEARCH_BACKENDS = {
     "default": {
         "BACKEND": "wagtail.search.backends.database",
+        "AUTO_UPDATE": True,
+        "SEARCH_CONFIG": "english",
     },
 }
 
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-15 02:55
+
+import datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("news", "0023_alter_newsitem_body"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="newsitem",
+            name="publication_date",
+            field=models.DateField(db_index=True, default=datetime.date.today),
+        ),
+    ]
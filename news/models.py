@@ -1,7 +1,9 @@
-from datetime import date, datetime
+from datetime import date
 
 from django.db import models
+from django.db.models import Min
 from django.http import HttpRequest
+from django.utils import timezone
 from modelcluster.fields import ParentalKey
 from modelcluster.contrib.taggit import ClusterTaggableManager
 from taggit.models import TaggedItemBase
@@ -9,7 +11,7 @@ from wagtail import blocks as wagtail_blocks
 from wagtail.admin.panels import FieldPanel, MultiFieldPanel
 from wagtail.embeds.blocks import EmbedBlock
 from wagtail.fields import RichTextField, StreamField
-from wagtail.models import Page
+from wagtail.models import Page, PageManager
 from wagtail.search import index
 
 from blocks.blocks import (
@@ -18,9 +20,15 @@ from blocks.blocks import (
     PullQuoteBlock,
     SpacerBlock,
 )
+from common.cache import get_or_set_versioned
 from common.models import DrupalFields
 from documents.blocks import DocumentEmbedBlock
 
+# Cache key holding the version of all cached news item data
+NEWS_ITEMS_CACHE_VERSION_KEY = "news_items_cache_version"
+NEWS_INDEX_CACHE_TIMEOUT = 60 * 60  # one hour
+NEWS_YEARS_CACHE_TIMEOUT = 60 * 60 * 24  # one day
+
 
 class NewsIndexPage(Page):
     intro = RichTextField(blank=True)
@@ -45,29 +53,68 @@ class NewsIndexPage(Page):
     ) -> dict[str, list]:
         context = super().get_context(request)
 
-        current_year = datetime.now().year
-        earliest = NewsItem.objects.order_by("publication_date").first()
+        # Use the site time zone, rather than the server time zone
+        current_year = timezone.localdate().year
+
+        def get_earliest_year() -> int:
+            earliest_publication_date = NewsItem.objects.live().aggregate(
+                earliest_publication_date=Min("publication_date"),
+            )["earliest_publication_date"]
+
+            if earliest_publication_date is None:
+                return current_year
 
-        if earliest is None:
-            earliest_year = current_year
-        else:
-            earliest_year = earliest.publication_date.year
+            return earliest_publication_date.year
+
+        # News items only change when an editor saves or deletes one,
+        # which starts a new cache version (see news.signals)
+        earliest_year = get_or_set_versioned(
+            NEWS_ITEMS_CACHE_VERSION_KEY,
+            "news_earliest_year",
+            get_earliest_year,
+            NEWS_YEARS_CACHE_TIMEOUT,
+        )
 
         # Get inclusive set of years from earliest to current (hence +1)
         context["news_years"] = range(earliest_year, current_year + 1)
 
         default_year = current_year
-        context["selected_year"] = int(request.GET.get("year", default_year))
-
-        # Filter live (not draft) news items
-        # and items from selected year
-        # reverse chronological order
-        context["news_items"] = (
-            NewsItem.objects.live()
-            .filter(publication_date__year=context["selected_year"])
-            .order_by("-publication_date")
+
+        try:
+            selected_year = int(request.GET.get("year", default_year))
+        except ValueError:
+            # Ignore invalid year values, e.g., "?year=abc"
+            selected_year = default_year
+
+        context["selected_year"] = selected_year
+
+        # There are no news items outside of the news years,
+        # so avoid querying for them
+        if selected_year not in context["news_years"]:
+            context["news_items"] = []
+
+            return context
+
+        news_items = NewsItem.objects.live_for_year(selected_year)
+
+        # Cache only the ordered IDs, since page data such as url_path
+        # can change without saving the news items, e.g., when an ancestor
+        # page is moved or its slug is changed
+        news_item_ids = get_or_set_versioned(
+            NEWS_ITEMS_CACHE_VERSION_KEY,
+            f"news_index:{self.id}:{selected_year}",
+            lambda: list(news_items.values_list("pk", flat=True)),
+            NEWS_INDEX_CACHE_TIMEOUT,
         )
 
+        news_items_by_id = news_items.in_bulk(news_item_ids)
+
+        context["news_items"] = [
+            news_items_by_id[news_item_id]
+            for news_item_id in news_item_ids
+            if news_item_id in news_items_by_id
+        ]
+
         return context
 
 
@@ -141,6 +188,20 @@ class NewsItemTag(TaggedItemBase):
     )
 
 
+class NewsItemManager(PageManager):
+    def live_for_year(self, year: int) -> models.QuerySet["NewsItem"]:
+        """Get live (not draft) news items from the given year,
+        in reverse chronological order, for display in news lists.
+        """
+        return (
+            self.live()
+            # skip the large body fields, which aren't shown in lists
+            .defer("body", "body_migrated", "drupal_body_migrated")
+            .filter(publication_date__year=year)
+            .order_by("-publication_date")
+        )
+
+
 class NewsItem(DrupalFields, Page):
     teaser = models.TextField(
         max_length=100,
@@ -148,7 +209,7 @@ class NewsItem(DrupalFields, Page):
         blank=True,
         help_text="Briefly summarize the news item for display in news lists",
     )
-    publication_date = models.DateField(default=date.today)
+    publication_date = models.DateField(default=date.today, db_index=True)
     body = StreamField(
         [
             ("heading", HeadingBlock()),
@@ -204,6 +265,8 @@ class NewsItem(DrupalFields, Page):
         blank=True,
     )
 
+    objects = NewsItemManager()
+
     content_panels = Page.content_panels + [
         FieldPanel("teaser"),
         FieldPanel("body"),
@@ -0,0 +1,31 @@
+from typing import Any
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from wagtail.models import Page
+
+from common.cache import invalidate_cache_version
+from news.models import NEWS_ITEMS_CACHE_VERSION_KEY, NewsItem
+
+
+@receiver(post_save, sender=NewsItem)
+@receiver(post_delete, sender=NewsItem)
+def invalidate_news_items_cache_on_change(**kwargs: Any) -> None:
+    """Drop cached news item listings whenever a NewsItem changes."""
+    invalidate_cache_version(NEWS_ITEMS_CACHE_VERSION_KEY)
+
+
+@receiver(post_save, sender=Page)
+def invalidate_news_items_cache_on_page_change(
+    instance: Page,
+    **kwargs: Any,
+) -> None:
+    """Drop cached news item listings when a NewsItem is saved as a base Page.
+
+    Wagtail saves the base Page when unpublishing and when publishing
+    scheduled pages, which doesn't send signals for the NewsItem model.
+    """
+    specific_class = instance.specific_class
+
+    if specific_class is not None and issubclass(specific_class, NewsItem):
+        invalidate_cache_version(NEWS_ITEMS_CACHE_VERSION_KEY)
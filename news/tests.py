@@ -1,5 +1,7 @@
-from datetime import datetime
-from django.test import RequestFactory, TestCase
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils import timezone
+from wagtail.models import Page
 from home.models import HomePage
 
 from news.models import (
@@ -116,12 +118,31 @@ class TestNewsItem(TestCase):
         )
 
 
+class TestNewsItemManager(TestCase):
+    def test_live_for_year(self) -> None:
+        """Test that only live news items from the given year are listed, newest first."""
+        older_news_item = NewsItemFactory.create(publication_date="2020-03-01")
+        newer_news_item = NewsItemFactory.create(publication_date="2020-06-01")
+
+        # Should not be listed
+        NewsItemFactory.create(publication_date="2020-09-01", live=False)
+        NewsItemFactory.create(publication_date="2021-01-01")
+
+        self.assertEqual(
+            list(NewsItem.objects.live_for_year(2020)),
+            [newer_news_item, older_news_item],
+        )
+
+
+@override_settings(SHARED_CACHE=True)
 class TestNewsIndexPageGetContext(TestCase):
     def setUp(self) -> None:
+        cache.clear()
+
         self.factory = RequestFactory()
 
         # Get the current year
-        self.current_year = datetime.now().year
+        self.current_year = timezone.localdate().year
 
         # Get or Create a NewsIndexPage
         self.news_index_page = NewsIndexPageFactory.create()
@@ -153,3 +174,150 @@ class TestNewsIndexPageGetContext(TestCase):
             list(context["news_items"]),
             list(NewsItem.objects.filter(publication_date__year=self.current_year)),
         )
+
+    def test_get_context_news_items_cached(self) -> None:
+        request = self.factory.get("/")
+
+        # Populate the cache
+        self.news_index_page.get_context(request)
+
+        # Only the news items are loaded, by their cached IDs
+        with self.assertNumQueries(1):
+            news_items = self.news_index_page.get_context(request)["news_items"]
+
+        self.assertEqual(
+            list(news_items),
+            list(NewsItem.objects.filter(publication_date__year=self.current_year)),
+        )
+
+    @override_settings(SHARED_CACHE=False)
+    def test_get_context_news_items_not_cached_without_shared_cache(
+        self,
+    ) -> None:
+        request = self.factory.get("/")
+
+        self.news_index_page.get_context(request)
+
+        # The news years and the news item IDs are queried again,
+        # along with the news items
+        with self.assertNumQueries(3):
+            self.news_index_page.get_context(request)
+
+    def test_get_context_news_items_cache_invalidated(self) -> None:
+        request = self.factory.get("/")
+
+        # Populate the cache
+        self.news_index_page.get_context(request)
+
+        new_news_item = NewsItemFactory.create(
+            publication_date=f"{self.current_year}-02-01",
+        )
+
+        context = self.news_index_page.get_context(request)
+
+        self.assertIn(new_news_item, context["news_items"])
+
+    def test_get_context_news_items_cache_invalidated_on_page_unpublish(
+        self,
+    ) -> None:
+        request = self.factory.get("/")
+
+        # Populate the cache
+        self.news_index_page.get_context(request)
+
+        news_item = self.news_items[-1]
+
+        # Unpublish through the base Page, as the Wagtail admin does
+        Page.objects.get(pk=news_item.pk).unpublish()
+
+        context = self.news_index_page.get_context(request)
+
+        self.assertNotIn(news_item, context["news_items"])
+
+    def test_get_context_news_items_url_path_after_parent_slug_change(
+        self,
+    ) -> None:
+        request = self.factory.get("/")
+
+        # Populate the cache
+        self.news_index_page.get_context(request)
+
+        # Wagtail updates the descendant url paths without saving the news items
+        self.news_index_page.slug = "news-renamed"
+        self.news_index_page.save()
+
+        context = self.news_index_page.get_context(request)
+
+        self.assertTrue(context["news_items"])
+
+        for news_item in context["news_items"]:
+            self.assertIn("/news-renamed/", news_item.url_path)
+
+    def test_get_context_news_years_cache_invalidated(self) -> None:
+        request = self.factory.get("/")
+
+        # Populate the cache
+        self.news_index_page.get_context(request)
+
+        NewsItemFactory.create(publication_date="2010-01-01")
+
+        context = self.news_index_page.get_context(request)
+
+        self.assertEqual(
+            list(context["news_years"]),
+            list(range(2010, self.current_year + 1)),
+        )
+
+    def test_get_context_news_years_cache_invalidated_on_page_unpublish(
+        self,
+    ) -> None:
+        request = self.factory.get("/")
+
+        # Populate the cache
+        self.news_index_page.get_context(request)
+
+        # Unpublish the earliest news item through the base Page
+        Page.objects.get(pk=self.news_items[0].pk).unpublish()
+
+        context = self.news_index_page.get_context(request)
+
+        self.assertEqual(
+            list(context["news_years"]),
+            list(range(2019, self.current_year + 1)),
+        )
+
+    def test_get_context_news_years_ignore_draft_news_items(self) -> None:
+        NewsItemFactory.create(publication_date="2010-01-01", live=False)
+
+        request = self.factory.get("/")
+        context = self.news_index_page.get_context(request)
+
+        self.assertEqual(
+            list(context["news_years"]),
+            list(range(2018, self.current_year + 1)),
+        )
+
+    def test_get_context_news_items_defer_body(self) -> None:
+        request = self.factory.get("/")
+        context = self.news_index_page.get_context(request)
+
+        for news_item in context["news_items"]:
+            self.assertTrue(
+                {"body", "body_migrated", "drupal_body_migrated"}.issubset(
+                    news_item.get_deferred_fields(),
+                ),
+            )
+
+    def test_get_context_invalid_year(self) -> None:
+        request = self.factory.get("/", {"year": "invalid"})
+        context = self.news_index_page.get_context(request)
+
+        # Invalid years fall back to the current year
+        self.assertEqual(context["selected_year"], self.current_year)
+
+    def test_get_context_year_without_news(self) -> None:
+        request = self.factory.get("/", {"year": "1900"})
+        context = self.news_index_page.get_context(request)
+
+        self.assertEqual(context["selected_year"], 1900)
+        self.assertEqual(list(context["news_items"]), [])
@@ -1,18 +1,11 @@
-from typing import Any
 from django import forms
 
 from .models import Order
 
 
 class OrderCreateForm(forms.ModelForm):
-    def __init__(
-        self,
-        *args: Any,
-        **kwargs: Any,
-    ) -> None:
-        super().__init__(*args, **kwargs)
-        self.fields["shipping_cost"].widget = forms.HiddenInput()
-
+    # Note: shipping cost is calculated from the cart, in the view,
+    # so users can't change its value
     class Meta:
         model = Order
         fields = [
@@ -27,7 +20,6 @@ class OrderCreateForm(forms.ModelForm):
             "recipient_address_locality",
             "recipient_address_region",
             "recipient_address_country",
-            "shipping_cost",
         ]
 
         labels = {
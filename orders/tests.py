@@ -131,6 +131,32 @@ class OrderCreateViewTest(TestCase):
         # Check if the correct template was used
         self.assertTemplateUsed(response, "orders/create.html")
 
+    def test_order_create_view_get_request_cart_totals(self) -> None:
+        # Add two books to the cart in the client session
+        session = self.client.session
+        session["cart"] = {
+            "1": {
+                "product_title": "Product 1",
+                "product_id": "1",
+                "quantity": 2,
+                "price": "10.00",
+            },
+        }
+        session.save()
+
+        response = self.client.get(reverse("orders:order_create"))
+
+        self.assertEqual(len(response.context["cart_items"]), 1)
+        self.assertEqual(
+            response.context["cart_totals"],
+            {
+                "subtotal": Decimal("20.00"),
+                "shipping": Decimal("8.00"),
+                "total": Decimal("28.00"),
+            },
+        )
+        self.assertContains(response, "$28.00")
+
     def test_order_create_view_post_request_form_valid(self) -> None:
         # Mock the OrderCreateForm
         with patch("orders.views.OrderCreateForm") as MockOrderCreateForm:
@@ -169,6 +195,45 @@ class OrderCreateViewTest(TestCase):
                 fetch_redirect_response=False,
             )
 
+    def test_order_create_view_post_request_calculates_shipping_cost(self) -> None:
+        # Add two books to the cart in the client session
+        session = self.client.session
+        session["cart"] = {
+            "1": {
+                "product_title": "Product 1",
+                "product_id": "1",
+                "quantity": 2,
+                "price": "10.00",
+            },
+        }
+        session.save()
+
+        # Attempt to submit a different shipping cost
+        response = self.client.post(
+            reverse("orders:order_create"),
+            {
+                "purchaser_email": "john@example.com",
+                "recipient_name": "John Doe",
+                "recipient_postal_code": "12345",
+                "recipient_address_locality": "Anytown",
+                "recipient_address_country": "United States",
+                "shipping_cost": "0.00",
+            },
+        )
+
+        self.assertEqual(
+            response.status_code,
+            HTTPStatus.FOUND,
+        )
+
+        order = Order.objects.get()
+
+        # Shipping cost is calculated from the cart, two books at four dollars each
+        self.assertEqual(
+            order.shipping_cost,
+            Decimal("8.00"),
+        )
+
     def test_order_create_view_post_request_form_invalid(self) -> None:
         # Create a dictionary with the invalid data you want to test
         invalid_data = {
@@ -273,3 +338,11 @@ class CreateCartOrderItemsTest(TestCase):
             item2.quantity,
             self.product2_quantity,
         )
+
+    def test_create_cart_order_items_query_count(self) -> None:
+        # One query to fetch the cart products, one to insert the order items
+        with self.assertNumQueries(2):
+            create_cart_order_items(
+                self.order,
+                self.cart,
+            )
@@ -1,4 +1,5 @@
-from django.http import HttpRequest, HttpResponse, QueryDict
+from django.db import transaction
+from django.http import HttpRequest, HttpResponse
 from django.shortcuts import redirect, render
 from django.urls import reverse
 
@@ -13,14 +14,19 @@ def create_cart_order_items(
 ) -> None:
     """Create OrderItems from Cart items."""
 
-    for item in cart:
-        OrderItem.objects.create(
-            order=order,
-            product_title=item["product_title"],
-            product_id=item["product_id"],
-            price=item["price"],
-            quantity=item["quantity"],
-        )
+    # Insert all order items in a single query
+    OrderItem.objects.bulk_create(
+        [
+            OrderItem(
+                order=order,
+                product_title=item["product_title"],
+                product_id=item["product_id"],
+                price=item["price"],
+                quantity=item["quantity"],
+            )
+            for item in cart
+        ],
+    )
 
 
 def order_create(request: HttpRequest) -> HttpResponse:
@@ -28,20 +34,19 @@ def order_create(request: HttpRequest) -> HttpResponse:
     cart = Cart(request)
 
     if request.method == "POST":
-        # Create copy of cart,
-        # so we can modify shipping cost
-        cart_order: QueryDict = request.POST.copy()
-
-        # Calculate shipping cost, to prevent users from changing value
-        cart_order["shipping_cost"] = str(cart.get_shipping_cost())
-
-        # Instantiate form with updated cart order (incl. shipping cost)
-        form = OrderCreateForm(cart_order)
+        form = OrderCreateForm(request.POST)
 
         if form.is_valid():
-            order = form.save()
+            # Save the order and its items together,
+            # so an order is never left without its items
+            with transaction.atomic():
+                order = form.save(commit=False)
+
+                # Calculate shipping cost, to prevent users from changing value
+                order.shipping_cost = cart.get_shipping_cost()
+                order.save()
 
-            create_cart_order_items(order, cart)
+                create_cart_order_items(order, cart)
 
             return redirect(
                 reverse(
@@ -51,24 +56,25 @@ def order_create(request: HttpRequest) -> HttpResponse:
                     },
                 ),
             )
-        else:
-            return render(
-                request,
-                template_name="orders/create.html",
-                context={
-                    "cart": cart,
-                    "form": form,
-                },
-            )
-
     else:
         form = OrderCreateForm()
 
-        return render(
-            request,
-            template_name="orders/create.html",
-            context={
-                "cart": cart,
-                "form": form,
-            },
-        )
+    # Iterating the cart queries the cart products,
+    # so only do it once, rather than in the template
+    cart_items = list(cart)
+    cart_totals = {
+        "subtotal": cart.get_subtotal_cost(),
+        "shipping": cart.get_shipping_cost(),
+        "total": cart.get_total_cost(),
+    }
+
+    # Show the empty form, or the submitted form with validation errors
+    return render(
+        request,
+        template_name="orders/create.html",
+        context={
+            "cart_items": cart_items,
+            "cart_totals": cart_totals,
+            "form": form,
+        },
+    )
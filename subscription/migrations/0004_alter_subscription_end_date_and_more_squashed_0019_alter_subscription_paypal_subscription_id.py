@@ -0,0 +1,176 @@
+# Generated by Django 4.2.7 on 2026-10-15 03:09
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import wagtail.blocks
+import wagtail.fields
+
+
+class Migration(migrations.Migration):
+    replaces = [
+        ("subscription", "0004_alter_subscription_end_date_and_more"),
+        ("subscription", "0005_alter_subscription_user"),
+        ("subscription", "0006_alter_subscription_price_group"),
+        ("subscription", "0007_remove_subscription_braintree_subscription_id"),
+        ("subscription", "0008_subscription_paypal_subscription_id"),
+        ("subscription", "0009_alter_subscription_paypal_subscription_id"),
+        ("subscription", "0010_subscription_subscriptio_paypal__0e9eb0_idx"),
+        ("subscription", "0011_remove_subscription_end_date_and_more"),
+        ("subscription", "0012_subscriptionindexpage_body"),
+        ("subscription", "0013_alter_subscription_user"),
+        ("subscription", "0014_alter_subscriptionindexpage_body"),
+        ("subscription", "0015_alter_subscription_user"),
+        ("subscription", "0016_alter_subscriptionindexpage_body"),
+        ("subscription", "0017_alter_subscriptionindexpage_body"),
+        ("subscription", "0018_subscription_expiration_date_and_more"),
+        ("subscription", "0019_alter_subscription_paypal_subscription_id"),
+    ]
+
+    dependencies = [
+        (
+            "subscription",
+            "0001_squashed_0003_rename_format_subscription_magazine_format",
+        ),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name="subscription",
+            name="braintree_subscription_id",
+        ),
+        migrations.RemoveField(
+            model_name="subscription",
+            name="end_date",
+        ),
+        migrations.RemoveField(
+            model_name="subscription",
+            name="magazine_format",
+        ),
+        migrations.RemoveField(
+            model_name="subscription",
+            name="paid",
+        ),
+        migrations.RemoveField(
+            model_name="subscription",
+            name="price",
+        ),
+        migrations.RemoveField(
+            model_name="subscription",
+            name="price_group",
+        ),
+        migrations.RemoveField(
+            model_name="subscription",
+            name="recurring",
+        ),
+        migrations.RemoveField(
+            model_name="subscription",
+            name="start_date",
+        ),
+        migrations.RemoveField(
+            model_name="subscription",
+            name="subscriber_address_country",
+        ),
+        migrations.RemoveField(
+            model_name="subscription",
+            name="subscriber_address_locality",
+        ),
+        migrations.RemoveField(
+            model_name="subscription",
+            name="subscriber_address_region",
+        ),
+        migrations.RemoveField(
+            model_name="subscription",
+            name="subscriber_family_name",
+        ),
+        migrations.RemoveField(
+            model_name="subscription",
+            name="subscriber_given_name",
+        ),
+        migrations.RemoveField(
+            model_name="subscription",
+            name="subscriber_organization",
+        ),
+        migrations.RemoveField(
+            model_name="subscription",
+            name="subscriber_postal_code",
+        ),
+        migrations.RemoveField(
+            model_name="subscription",
+            name="subscriber_street_address",
+        ),
+        migrations.RemoveField(
+            model_name="subscription",
+            name="subscriber_street_address_line_2",
+        ),
+        migrations.AlterField(
+            model_name="subscription",
+            name="user",
+            field=models.OneToOneField(
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="subscription",
+                to=settings.AUTH_USER_MODEL,
+                verbose_name="subscriber",
+            ),
+        ),
+        migrations.AddField(
+            model_name="subscription",
+            name="paypal_subscription_id",
+            field=models.CharField(
+                blank=True,
+                help_text="The PayPal subscription ID. If this field has a value, PayPal will manage the expiration date.",
+                max_length=255,
+                null=True,
+                unique=True,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="subscription",
+            index=models.Index(
+                fields=["paypal_subscription_id"], name="subscriptio_paypal__0e9eb0_idx"
+            ),
+        ),
+        migrations.AddField(
+            model_name="subscription",
+            name="expiration_date",
+            field=models.DateField(
+                blank=True,
+                help_text="The date the subscription expires. Leave blank for perpetual subscriptions.",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="subscriptionindexpage",
+            name="body",
+            field=wagtail.fields.StreamField(
+                [
+                    ("paragraph", wagtail.blocks.RichTextBlock()),
+                    (
+                        "paypal_card_row",
+                        wagtail.blocks.ListBlock(
+                            wagtail.blocks.StructBlock(
+                                [
+                                    (
+                                        "paypal_plan_id",
+                                        wagtail.blocks.CharBlock(required=True),
+                                    ),
+                                    (
+                                        "paypal_plan_name",
+                                        wagtail.blocks.CharBlock(required=True),
+                                    ),
+                                    (
+                                        "paypal_plan_price",
+                                        wagtail.blocks.IntegerBlock(required=True),
+                                    ),
+                                ]
+                            ),
+                            template="blocks/blocks/card_row.html",
+                        ),
+                    ),
+                ],
+                blank=True,
+                use_json_field=True,
+            ),
+        ),
+    ]